@@ -2,8 +2,9 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 import mock
+from django.db.models import Q
 
-from test_project.one_to_one.models import Place
+from test_project.one_to_one.models import Place, Restaurant, Waiter
 from url_filter.backends.django import DjangoFilterBackend
 from url_filter.utils import FilterSpec
 
@@ -15,6 +16,13 @@ class TestDjangoFilterBackend(object):
         assert backend.model is Place
         assert backend.context == {"context": "here"}
 
+    def test_init_context_not_copied(self):
+        context = {}
+        backend = DjangoFilterBackend(Place.objects.all(), context=context)
+
+        assert backend.context is context
+        assert DjangoFilterBackend(Place.objects.all()).context == {}
+
     def test_empty(self):
         backend = DjangoFilterBackend(Place.objects.all(), context={"context": "here"})
 
@@ -25,6 +33,16 @@ class TestDjangoFilterBackend(object):
 
         assert backend.get_model() is Place
 
+    def test_model_cached(self):
+        backend = DjangoFilterBackend(Place.objects.all())
+
+        with mock.patch.object(backend, "get_model", return_value=Place) as get_model:
+            assert backend.model is Place
+            assert backend.model is Place
+
+        assert get_model.call_count == 1
+        assert backend.__dict__["model"] is Place
+
     def test_bind(self):
         backend = DjangoFilterBackend(Place.objects.all())
 
@@ -76,12 +94,140 @@ class TestDjangoFilterBackend(object):
 
         result = backend.filter()
 
-        assert result == qs.filter.return_value.exclude.return_value
-        qs.filter.assert_called_once_with(name__exact="value")
-        qs.filter.return_value.exclude.assert_called_once_with(
-            address__contains="value"
+        assert result == qs.filter.return_value
+        qs.filter.assert_called_once_with(
+            Q(name__exact="value") & ~Q(address__contains="value")
+        )
+
+    def test_filter_multiple_excludes(self, db):
+        one = Place.objects.create(name="one", address="one")
+        Place.objects.create(name="one", address="two")
+        Place.objects.create(name="two", address="one")
+
+        backend = DjangoFilterBackend(Place.objects.all())
+        backend.bind(
+            [
+                FilterSpec(["name"], "exact", "two", True),
+                FilterSpec(["address"], "exact", "two", True),
+            ]
+        )
+
+        assert list(backend.filter()) == [one]
+
+    def test_filter_repeated_lookups(self, db):
+        one = Place.objects.create(name="one", address="one")
+        Place.objects.create(name="two", address="two")
+        Place.objects.create(name="three", address="three")
+
+        backend = DjangoFilterBackend(Place.objects.all())
+        backend.bind(
+            [
+                FilterSpec(["name"], "exact", "one", False),
+                FilterSpec(["name"], "exact", "two", False),
+            ]
+        )
+        assert list(backend.filter()) == []
+
+        backend.bind(
+            [
+                FilterSpec(["name"], "exact", "two", True),
+                FilterSpec(["name"], "exact", "three", True),
+            ]
+        )
+        assert list(backend.filter()) == [one]
+
+    def test_filter_repeated_excludes_in(self):
+        qs = mock.Mock()
+
+        backend = DjangoFilterBackend(qs)
+        backend.model = Place
+        backend.bind(
+            [
+                FilterSpec(["name"], "exact", "one", True),
+                FilterSpec(["name"], "exact", "two", True),
+                FilterSpec(["address"], "contains", "one", True),
+                FilterSpec(["address"], "contains", "two", True),
+            ]
+        )
+
+        backend.filter()
+
+        qs.filter.assert_called_once_with(
+            ~Q(name__in=["one", "two"])
+            & ~Q(address__contains="one")
+            & ~Q(address__contains="two")
+        )
+
+    def test_filter_to_many_include_and_exclude(self, db):
+        places = {}
+        for name, waiters in [("p0", ["a"]), ("p1", ["a", "b"]), ("p2", ["b"])]:
+            place = places[name] = Place.objects.create(name=name, address=name)
+            restaurant = Restaurant.objects.create(place=place)
+            for waiter in waiters:
+                Waiter.objects.create(restaurant=restaurant, name=waiter)
+
+        backend = DjangoFilterBackend(Place.objects.all())
+        backend.bind(
+            [
+                FilterSpec(["restaurant", "waiter", "name"], "exact", "a", False),
+                FilterSpec(["restaurant", "waiter", "name"], "exact", "b", True),
+            ]
+        )
+
+        assert list(backend.filter()) == [places["p0"]]
+
+    def test_filter_to_many_repeated_includes(self, db):
+        places = {}
+        for name, waiters in [("p0", ["a"]), ("p1", ["a", "c"]), ("p2", ["c"])]:
+            place = places[name] = Place.objects.create(name=name, address=name)
+            restaurant = Restaurant.objects.create(place=place)
+            for waiter in waiters:
+                Waiter.objects.create(restaurant=restaurant, name=waiter)
+
+        backend = DjangoFilterBackend(Place.objects.all())
+        backend.bind(
+            [
+                FilterSpec(["restaurant", "waiter", "name"], "exact", "a", False),
+                FilterSpec(["restaurant", "waiter", "name"], "exact", "c", False),
+            ]
+        )
+
+        assert list(backend.filter()) == [places["p1"]]
+
+    def test_filter_to_many_excludes(self):
+        qs = mock.Mock()
+
+        backend = DjangoFilterBackend(qs)
+        backend.model = Place
+        backend.bind(
+            [
+                FilterSpec(["name"], "exact", "one", False),
+                FilterSpec(["restaurant", "waiter", "name"], "exact", "a", True),
+                FilterSpec(["restaurant", "waiter", "name"], "contains", "b", True),
+            ]
         )
 
+        backend.filter()
+
+        qs.filter.assert_called_once_with(Q(name__exact="one"))
+        filtered = qs.filter.return_value
+        filtered.exclude.assert_called_once_with(Q(restaurant__waiter__name__exact="a"))
+        filtered.exclude.return_value.exclude.assert_called_once_with(
+            Q(restaurant__waiter__name__contains="b")
+        )
+
+    def test_filter_no_specs(self):
+        qs = mock.Mock()
+
+        backend = DjangoFilterBackend(qs)
+        backend.bind([])
+
+        assert backend.filter() is qs
+        assert not qs.filter.called
+
+        assert backend.filter_by_specs(qs) is qs
+        assert backend.filter_by_callables(qs) is qs
+
     def test_filter_to_many(self):
         qs = mock.Mock()
 
@@ -94,7 +240,66 @@ class TestDjangoFilterBackend(object):
         result = backend.filter()
 
         assert result == qs.filter.return_value.distinct.return_value
-        qs.filter.assert_called_once_with(restaurant__waiter__name__exact="value")
+        qs.filter.assert_called_once_with(Q(restaurant__waiter__name__exact="value"))
+
+    def test_filter_to_one(self):
+        qs = mock.Mock()
+
+        backend = DjangoFilterBackend(qs)
+        backend.model = Waiter
+        backend.bind(
+            [FilterSpec(["restaurant", "place", "name"], "exact", "value", False)]
+        )
+
+        result = backend.filter()
+
+        assert result == qs.filter.return_value
+        assert not qs.filter.return_value.distinct.called
+
+    def test_is_to_many_cached(self):
+        backend = DjangoFilterBackend(Place.objects.all())
+        backend.bind([FilterSpec(["restaurant", "waiter", "name"], "exact", "a")])
+
+        with mock.patch.dict(DjangoFilterBackend._to_many_cache, clear=True):
+            with mock.patch.object(
+                backend, "_is_to_many", wraps=backend._is_to_many
+            ) as mock_is_to_many:
+                assert backend._is_any_to_many()
+                call_count = mock_is_to_many.call_count
+                assert backend._is_any_to_many()
+
+        assert mock_is_to_many.call_count == call_count
+
+    def test_bind_resets_specs(self):
+        backend = DjangoFilterBackend(Place.objects.all())
+        regular = FilterSpec(["name"], "exact", "value", False)
+        callable_spec = FilterSpec(["name"], "exact", "value", False, len)
+
+        backend.bind([regular])
+        assert backend.regular_specs == [regular]
+        assert backend.callable_specs == []
+
+        backend.bind([callable_spec])
+        assert backend.regular_specs == []
+        assert backend.callable_specs == [callable_spec]
+
+    def test_specs_falsy_callable(self):
+        class FalsyCallable(object):
+            def __call__(self, queryset, spec):
+                return queryset
+
+            def __bool__(self):
+                return False
+
+            __nonzero__ = __bool__
+
+        spec = FilterSpec(["name"], "exact", "value", False, FalsyCallable())
+        backend = DjangoFilterBackend(Place.objects.all())
+        backend.bind([spec])
+
+        assert spec.is_callable
+        assert backend.regular_specs == []
+        assert backend.callable_specs == [spec]
 
     def test_filter_callable_specs(self):
         qs = mock.Mock()
@@ -110,3 +315,28 @@ class TestDjangoFilterBackend(object):
 
         assert result == qs.filter.return_value
         qs.filter.assert_called_once_with(spec)
+
+    def test_filter_callable_specs_q(self):
+        qs = mock.Mock()
+
+        def foo(queryset, spec):
+            return Q(name=spec.value)
+
+        foo.returns_q = True
+
+        def bar(queryset, spec):
+            return queryset.exclude(spec)
+
+        specs = [
+            FilterSpec(["name"], "exact", "one", False, foo),
+            FilterSpec(["name"], "exact", "value", False, bar),
+            FilterSpec(["name"], "exact", "two", False, foo),
+        ]
+        backend = DjangoFilterBackend(qs)
+        backend.bind(specs)
+
+        result = backend.filter()
+
+        assert result == qs.filter.return_value.exclude.return_value
+        qs.filter.assert_called_once_with(Q(name="one") & Q(name="two"))
+        qs.filter.return_value.exclude.assert_called_once_with(specs[1])
@@ -2,8 +2,10 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from datetime import datetime
 
+import mock
+
 from url_filter.backends.plain import PlainFilterBackend
-from url_filter.utils import FilterSpec
+from url_filter.utils import FilterSpec, dictify
 
 
 class Bunch(object):
@@ -94,6 +96,22 @@ class TestPlainFilterBackend(object):
             FilterSpec(["restaurant", "waiters", "name"], "exact", "John", True), DATA
         )
 
+    def test_filter_property(self):
+        class Person(object):
+            def __init__(self, first, last):
+                self.first = first
+                self.last = last
+
+            @property
+            def full(self):
+                return self.first + self.last
+
+        data = [Person("x", "1"), Person("y", "2")]
+        backend = PlainFilterBackend(data)
+        backend.bind([FilterSpec(["full"], "exact", "x1", False)])
+
+        assert backend.filter() == [data[0]]
+
     def test_filter_gt(self):
         self._test_filter(FilterSpec(["id"], "gt", 1, False), [DATA[1]])
 
@@ -133,9 +151,50 @@ class TestPlainFilterBackend(object):
             [DATA[1]],
         )
 
+    def test_filter_case_insensitive_spec_value(self):
+        self._test_filter(
+            FilterSpec(
+                ["restaurant", "waiters", "name"], "iin", ["JOHN", "Steve"], False
+            ),
+            [DATA[1]],
+        )
+        self._test_filter(
+            FilterSpec(["restaurant", "waiters", "name"], "iexact", "STEVE", False),
+            [DATA[1]],
+        )
+
+    def test_filter_iin_not_compiled(self):
+        data = [{"a": "X"}, {"a": "y"}]
+        backend = PlainFilterBackend(data)
+        # 5 cannot be lowercased hence comparison fails which counts as match
+        backend.bind([FilterSpec(["a"], "iin", ["X", 5], False)])
+
+        assert backend.filter() == data
+
+    def test_compare_not_compiled_spec(self):
+        backend = PlainFilterBackend([])
+
+        assert backend._compare_icontains("FOO", FilterSpec([], "icontains", "FOO"))
+        assert backend._compare_iendswith("FOO", FilterSpec([], "iendswith", "Oo"))
+        assert backend._compare_iexact("FOO", FilterSpec([], "iexact", "Foo"))
+        assert backend._compare_iin("FOO", FilterSpec([], "iin", ["Foo"]))
+        assert backend._compare_istartswith("FOO", FilterSpec([], "istartswith", "fO"))
+        assert backend._compare_iregex("FOO", FilterSpec([], "iregex", "f.o"))
+        assert backend._compare_regex("foo", FilterSpec([], "regex", "f.o"))
+
     def test_filter_in_simple_list(self):
         self._test_filter(FilterSpec(["nicknames"], "in", ["ace", "dogs"], False), DATA)
 
+    def test_filter_in_unhashable(self):
+        data = [{"meta": {"a": 1}}, {"meta": {"b": 2}}]
+        backend = PlainFilterBackend(data)
+
+        backend.bind([FilterSpec(["meta"], "in", [{"a": 1}], False)])
+        assert backend.filter() == [data[0]]
+
+        backend.bind([FilterSpec(["meta"], "in", ["a", "b"], False)])
+        assert backend.filter() == []
+
     def test_filter_isnull(self):
         self._test_filter(FilterSpec(["nulldata"], "isnull", True, False), [DATA[1]])
         self._test_filter(FilterSpec(["nulldata"], "isnull", False, False), [DATA[0]])
@@ -173,6 +232,11 @@ class TestPlainFilterBackend(object):
             [DATA[0]],
         )
 
+    def test_filter_regex_invalid(self):
+        self._test_filter(
+            FilterSpec(["restaurant", "waiters", "name"], "regex", r"(", False), DATA
+        )
+
     def test_filter_day(self):
         self._test_filter(FilterSpec(["created"], "day", 12, False), DATA)
 
@@ -196,5 +260,32 @@ class TestPlainFilterBackend(object):
             FilterSpec(["created"], "week_day", 2, False), [DATA[1]]  # Monday
         )
 
+    def test_filter_comparator_override(self):
+        class Backend(PlainFilterBackend):
+            def _compare_exact(self, value, spec):
+                return value != spec.value
+
+        backend = Backend(DATA)
+        backend.bind([FilterSpec(["id"], "exact", 1, False)])
+
+        assert backend.filter() == [DATA[1]]
+
+    def test_filter_dictify_once(self):
+        data = [Bunch(id=1, name="foo"), Bunch(id=2, name="bar")]
+        backend = PlainFilterBackend(data)
+        backend.bind(
+            [
+                FilterSpec(["id"], "gte", 1, False),
+                FilterSpec(["name"], "exact", "foo", False),
+            ]
+        )
+
+        with mock.patch(
+            "url_filter.backends.plain.dictify", side_effect=dictify
+        ) as mock_dictify:
+            assert backend.filter() == [data[0]]
+
+        assert mock_dictify.call_count == 2
+
     def test_filter_exception_handling(self):
         self._test_filter(FilterSpec(["id"], "week_day", 1, False), DATA)
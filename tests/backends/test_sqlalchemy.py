@@ -65,6 +65,23 @@ class TestSQLAlchemyFilterBackend(object):
         assert "JOIN one_to_one_restaurant" in sql
         assert "JOIN one_to_one_waiter" in sql
 
+    def test_filter_same_joins(self, alchemy_db):
+        backend = SQLAlchemyFilterBackend(alchemy_db.query(Place))
+        backend.bind(
+            [
+                FilterSpec(
+                    ["restaurant", "waiter_set", "name"], "exact", "John", False
+                ),
+                FilterSpec(["restaurant", "waiter_set", "id"], "exact", 1, False),
+            ]
+        )
+
+        filtered = backend.filter()
+
+        sql = six.text_type(filtered)
+        assert sql.count("JOIN one_to_one_restaurant") == 1
+        assert sql.count("JOIN one_to_one_waiter") == 1
+
     def test_filter_already_selectinload(self, alchemy_db):
         backend = SQLAlchemyFilterBackend(
             alchemy_db.query(Place).options(
@@ -226,6 +243,7 @@ class TestSQLAlchemyFilterBackend(object):
         properties = SQLAlchemyFilterBackend._get_properties_for_model(Waiter)
 
         assert set(properties) == {"restaurant", "id", "restaurant_id", "name"}
+        assert SQLAlchemyFilterBackend._get_properties_for_model(Waiter) is properties
 
     def test__get_column_for_field(self):
         properties = SQLAlchemyFilterBackend._get_properties_for_model(Waiter)
@@ -1,16 +1,19 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function, unicode_literals
 
+import mock
 import pytest
 from django import forms
 from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
 
 from test_project.one_to_one.models import Restaurant, Waiter
 from url_filter.backends.django import DjangoFilterBackend
+from url_filter.backends.plain import PlainFilterBackend
 from url_filter.constants import StrictMode
 from url_filter.exceptions import Empty
 from url_filter.filters import Filter
-from url_filter.filtersets.base import FilterSet
+from url_filter.filtersets.base import FilterKeyValidator, FilterSet
 from url_filter.utils import FilterSpec
 
 
@@ -54,6 +57,25 @@ class TestFilterSet(object):
         assert isinstance(filters["foo"], Filter)
         assert filters["foo"].parent is None
 
+    def test_get_filters_inherited(self):
+        class FooMixin(object):
+            foo = Filter(form_field=forms.CharField())
+
+        class BarFilterSet(FooMixin, FilterSet):
+            bar = Filter(form_field=forms.CharField())
+
+        class BazFilterSet(BarFilterSet):
+            baz = Filter(form_field=forms.CharField())
+
+        class OtherFilterSet(BazFilterSet):
+            bar = Filter(form_field=forms.IntegerField())
+
+        assert sorted(BazFilterSet._declared_filters) == ["bar", "baz", "foo"]
+        assert sorted(OtherFilterSet._declared_filters) == ["bar", "baz", "foo"]
+        assert isinstance(
+            OtherFilterSet._declared_filters["bar"].form_field, forms.IntegerField
+        )
+
     def test_filters(self):
         class TestFilterSet(FilterSet):
             foo = Filter(form_field=forms.CharField())
@@ -67,6 +89,23 @@ class TestFilterSet(object):
         assert filters["foo"].parent is fs
         assert filters["foo"].name == "foo"
 
+    def test_filters_components_rebind(self):
+        class ChildFilterSet(FilterSet):
+            foo = Filter(form_field=forms.CharField())
+
+        class RootFilterSet(FilterSet):
+            child = ChildFilterSet()
+
+        child = ChildFilterSet()
+        assert child.filters["foo"].components == ["foo"]
+
+        assert child.filters["foo"].root is child
+
+        root = RootFilterSet()
+        child.bind("child", root)
+        assert child.filters["foo"].components == ["child", "foo"]
+        assert child.filters["foo"].root is root
+
     def test_default_filter_no_default(self):
         class TestFilterSet(FilterSet):
             foo = Filter(form_field=forms.CharField())
@@ -91,6 +130,11 @@ class TestFilterSet(object):
         with pytest.raises(forms.ValidationError):
             FilterSet().validate_key("f!oo")
 
+        with pytest.raises(forms.ValidationError) as e:
+            FilterSet().validate_key("1foo")
+        assert e.value.message == FilterKeyValidator.message
+        assert e.value.code == FilterKeyValidator.code
+
     def test_get_filter_backend(self):
         backend = FilterSet().get_filter_backend()
 
@@ -106,6 +150,36 @@ class TestFilterSet(object):
         with pytest.raises(AssertionError):
             fs.filter()
 
+        fs = FilterSet(data={"foo": "bar"}, queryset=[])
+        with pytest.raises(AssertionError):
+            fs.filter()
+
+    def test_filter_data_multivaluedict(self):
+        class FooFilterSet(FilterSet):
+            filter_backend_class = PlainFilterBackend
+            foo = Filter(form_field=forms.CharField())
+
+        qs = [{"foo": "bar"}, {"foo": "baz"}]
+        fs = FooFilterSet(data=MultiValueDict({"foo": ["bar"]}), queryset=qs)
+
+        assert fs.filter() == [{"foo": "bar"}]
+
+    def test_filter_empty(self):
+        class FooFilterSet(FilterSet):
+            filter_backend_class = PlainFilterBackend
+            foo = Filter(form_field=forms.IntegerField())
+
+        fs = FooFilterSet(
+            data=QueryDict("foo=a"),
+            queryset=[{"foo": 1}],
+            strict_mode=StrictMode.empty,
+        )
+
+        with mock.patch.object(PlainFilterBackend, "filter") as mock_filter:
+            assert fs.filter() == []
+
+        assert not mock_filter.called
+
     def test_get_specs(self):
         class BarFilterSet(FilterSet):
             other = Filter(
@@ -10,7 +10,7 @@ from rest_framework.exceptions import ValidationError
 from test_project.one_to_one.api import PlaceFilterSet
 from test_project.one_to_one.models import Place, Restaurant
 from url_filter.filtersets import FilterSet, ModelFilterSet
-from url_filter.integrations.drf import DjangoFilterBackend
+from url_filter.integrations.drf import DjangoFilterBackend, _freeze
 
 
 class TestDjangoFilterBackend(object):
@@ -36,6 +36,42 @@ class TestDjangoFilterBackend(object):
         assert filter_class.Meta.model is Place
         assert filter_class.Meta.fields == ["name"]
 
+        assert (
+            DjangoFilterBackend().get_filter_class(View(), Place.objects.all())
+            is filter_class
+        )
+        assert (
+            DjangoFilterBackend().get_filter_class(View(), Restaurant.objects.all())
+            is not filter_class
+        )
+
+    def test_get_filter_class_uncacheable_meta_kwargs(self):
+        class View(object):
+            filter_fields = ["name"]
+            filter_class_meta_kwargs = {"extra": {1: "one", "two": 2}}
+
+        with mock.patch.dict(DjangoFilterBackend._filter_class_cache, clear=True):
+            filter_class = DjangoFilterBackend().get_filter_class(
+                View(), Place.objects.all()
+            )
+
+            assert DjangoFilterBackend._filter_class_cache == {}
+
+        assert issubclass(filter_class, ModelFilterSet)
+        assert filter_class.Meta.fields == ["name"]
+
+    def test_get_filter_class_meta_kwargs_cache_key(self):
+        class View(object):
+            filter_fields = ["name"]
+            filter_class_meta_kwargs = {"extra": {"a": 1}}
+
+        with mock.patch.dict(DjangoFilterBackend._filter_class_cache, clear=True):
+            first = DjangoFilterBackend().get_filter_class(View(), Place.objects.all())
+            View.filter_class_meta_kwargs = {"extra": [("a", 1)]}
+            second = DjangoFilterBackend().get_filter_class(View(), Place.objects.all())
+
+        assert first is not second
+
     def test_get_filter_class_all_fields(self):
         class View(object):
             filter_fields = "__all__"
@@ -60,16 +96,35 @@ class TestDjangoFilterBackend(object):
 
         assert context == {"request": "request", "view": "view"}
 
-    def test_get_filter_queryset_not_filtered(self):
-        assert DjangoFilterBackend().filter_queryset(None, None, None) is None
+    def test_get_filter_queryset_not_filtered(self, rf):
+        request = rf.get("/")
+        request.query_params = QueryDict("name=foo")
+
+        assert DjangoFilterBackend().filter_queryset(request, None, None) is None
 
     @mock.patch.object(FilterSet, "filter")
-    def test_get_filter_queryset(self, mock_filter, db, rf):
+    def test_get_filter_queryset_no_query(self, mock_filter, rf):
         class View(object):
             filter_fields = ["name"]
 
         request = rf.get("/")
         request.query_params = QueryDict()
+        queryset = Place.objects.all()
+
+        filtered = DjangoFilterBackend().filter_queryset(
+            request=request, queryset=queryset, view=View()
+        )
+
+        assert filtered is queryset
+        assert not mock_filter.called
+
+    @mock.patch.object(FilterSet, "filter")
+    def test_get_filter_queryset(self, mock_filter, db, rf):
+        class View(object):
+            filter_fields = ["name"]
+
+        request = rf.get("/")
+        request.query_params = QueryDict("name=foo")
 
         filtered = DjangoFilterBackend().filter_queryset(
             request=request, queryset=Place.objects.all(), view=View()
@@ -85,7 +140,7 @@ class TestDjangoFilterBackend(object):
             filter_fields = ["name"]
 
         request = rf.get("/")
-        request.query_params = QueryDict()
+        request.query_params = QueryDict("name=foo")
 
         with pytest.raises(ValidationError) as e:
             DjangoFilterBackend().filter_queryset(
@@ -101,9 +156,17 @@ class TestDjangoFilterBackend(object):
             filter_fields = ["name"]
 
         request = rf.get("/")
-        request.query_params = QueryDict()
+        request.query_params = QueryDict("name=foo")
 
         with pytest.raises(AssertionError):
             DjangoFilterBackend().filter_queryset(
                 request=request, queryset=Restaurant.objects.all(), view=View()
             )
+
+
+def test_freeze():
+    assert _freeze({"x": {"a": 1}}) != _freeze({"x": [("a", 1)]})
+    assert _freeze([1, 2]) != _freeze((1, 2))
+    assert _freeze({"a": 1}) != _freeze({"a": True})
+    assert _freeze({"a", "b"}) == _freeze({"b", "a"})
+    assert _freeze({"b": [1], "a": {2}}) == _freeze({"a": {2}, "b": [1]})
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function, unicode_literals
+from copy import deepcopy
 
 import pytest
 from django import forms
@@ -19,6 +20,16 @@ class TestMultipleValuesField(object):
         assert any((isinstance(i, MinLengthValidator) for i in field.many_validators))
         assert any((isinstance(i, MaxLengthValidator) for i in field.many_validators))
 
+    def test_deepcopy(self):
+        field = MultipleValuesField(child=forms.IntegerField())
+
+        copied = deepcopy(field)
+
+        assert copied.child is not field.child
+        assert isinstance(copied.child, forms.IntegerField)
+        assert copied.many_validators == field.many_validators
+        assert copied.many_validators is not field.many_validators
+
     def test_clean_empty(self):
         assert MultipleValuesField(required=False).clean("") is None
 
@@ -43,6 +54,30 @@ class TestMultipleValuesField(object):
 
         assert field.many_to_python("hello,world") == ["hello", "world"]
 
+    def test_many_to_python_integer(self):
+        field = MultipleValuesField(forms.IntegerField())
+
+        assert field.many_to_python("1, 2,3") == [1, 2, 3]
+        assert field.many_to_python("1.0,2") == [1, 2]
+        with pytest.raises(forms.ValidationError):
+            field.many_to_python("1,a")
+
+        field = MultipleValuesField(forms.IntegerField(min_value=2))
+
+        with pytest.raises(forms.ValidationError):
+            field.many_to_python("1,2")
+
+    def test_many_to_python_float(self):
+        field = MultipleValuesField(forms.FloatField())
+
+        assert field.many_to_python("1.5, 2,3") == [1.5, 2.0, 3.0]
+        with pytest.raises(forms.ValidationError):
+            field.many_to_python("1,a")
+        with pytest.raises(forms.ValidationError):
+            field.many_to_python("1,nan")
+        with pytest.raises(forms.ValidationError):
+            field.many_to_python("1,inf")
+
     def test_many_validate(self):
         assert MultipleValuesField().many_validate([1, 2]) is None
         with pytest.raises(forms.ValidationError):
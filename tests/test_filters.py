@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function, unicode_literals
+from copy import deepcopy
 from functools import partial
 
 import mock
@@ -81,6 +82,20 @@ class TestFilter(object):
         f.parent = p
         assert f.components == ["child"]
 
+    def test_components_rebind(self):
+        p = Filter(source="parent", form_field=forms.CharField())
+        f = Filter(source="child", form_field=forms.CharField())
+
+        f.bind("child", p)
+        assert f.components == ["child"]
+
+        f.bind("other", Filter(form_field=forms.CharField()))
+        assert f.components == ["child"]
+
+        f._source = None
+        f.bind("other", p)
+        assert f.components == ["other"]
+
     def test_bind(self):
         f = Filter(form_field=forms.CharField())
         f.bind("foo", "parent")
@@ -95,6 +110,21 @@ class TestFilter(object):
 
         assert f.root is p
 
+    def test_root_rebind(self):
+        p = Filter(source="parent", form_field=forms.CharField())
+        f = Filter(source="child", form_field=forms.CharField())
+
+        f.bind("child", p)
+        assert f.root is p
+
+        other = Filter(source="other", form_field=forms.CharField())
+        f.bind("child", other)
+        assert f.root is other
+
+        p.bind("parent", other)
+        f.bind("child", p)
+        assert f.root is other
+
     def test_get_form_field(self):
         f = Filter(form_field=forms.CharField())
 
@@ -102,6 +132,37 @@ class TestFilter(object):
         assert isinstance(f.get_form_field("in"), MultipleValuesField)
         assert isinstance(f.get_form_field("isnull"), forms.BooleanField)
 
+    def test_get_form_field_many_cached(self):
+        f = Filter(form_field=forms.IntegerField())
+
+        field = f.get_form_field("in")
+        assert f.get_form_field("in") is field
+        assert f.get_form_field("range") is not field
+        assert field.child is f.form_field
+
+        f.form_field = forms.CharField()
+        assert f.get_form_field("in") is not field
+        assert f.get_form_field("in").child is f.form_field
+
+    def test_deepcopy(self):
+        f = Filter(source="foo", form_field=forms.ChoiceField())
+        field = f.get_form_field("in")
+
+        c = deepcopy(f)
+
+        assert c is not f
+        assert c.source == "foo"
+        assert c.form_field is not f.form_field
+
+        # form fields can be customized per instance without affecting others
+        c.form_field.choices = [("a", "a")]
+        assert f.form_field.choices == []
+
+        # cache of multiple-value form fields is keyed by the copied form field
+        assert c.get_form_field("in") is not field
+        assert c.get_form_field("in").child is c.form_field
+        assert c.get_form_field("in") is c.get_form_field("in")
+
     def test_clean_value(self):
         f = Filter(form_field=forms.IntegerField())
 
@@ -135,6 +196,9 @@ class TestFilter(object):
             assert f.get_spec(
                 LookupConfig("key", {"foo": "value", "happy": "rainbows"})
             )
+        with pytest.raises(forms.ValidationError) as e:
+            assert f.get_spec(LookupConfig("key", {"in": {"exact": "value"}}))
+        assert "Data is more complex then expected" in e.value.messages[0]
         with pytest.raises(forms.ValidationError):
             f.no_lookup = True
             assert f.get_spec(LookupConfig("key", {"exact": "value"}))
@@ -184,6 +248,31 @@ class TestCallableFilter(object):
 
         assert f.lookups == set()
 
+    def test_get_custom_lookups(self):
+        class Foo(CallableFilter):
+            def filter_foo_for_django(self):
+                pass
+
+            def filter_bar_for_django(self):
+                pass
+
+            def filter_foo_for_plain(self):
+                pass
+
+        custom_lookups = Foo._get_custom_lookups()
+
+        assert custom_lookups == {"django": {"foo", "bar"}, "plain": {"foo"}}
+        assert Foo()._get_custom_lookups() is custom_lookups
+
+        class Bar(Foo):
+            def filter_baz_for_plain(self):
+                pass
+
+        assert Bar._get_custom_lookups() == {
+            "django": {"foo", "bar"},
+            "plain": {"foo", "baz"},
+        }
+
     def test_get_form_field(self):
         field = forms.CharField()
 
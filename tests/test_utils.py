@@ -33,6 +33,20 @@ class TestFilterSpec(object):
         assert a != c
         assert a != d
 
+    def test_components_tuple(self):
+        spec = FilterSpec(["a", "b"], "exact", "value")
+
+        assert spec.components == ("a", "b")
+        assert spec == FilterSpec(("a", "b"), "exact", "value", False)
+
+    def test_hash(self):
+        a = FilterSpec(["a"], "exact", "value", False)
+        b = FilterSpec(["a"], "in", ["value"], False)
+
+        assert hash(a) == hash(FilterSpec(["a"], "exact", "value", False))
+        assert hash(b) == hash(FilterSpec(["a"], "in", ["value"], False))
+        assert len({a, b}) == 2
+
 
 class TestLookupConfig(object):
     def test_repr(self):
@@ -49,6 +63,25 @@ class TestLookupConfig(object):
         assert config.value.data == "value"
         assert config.is_key_value()
 
+        assert not LookupConfig("foo", "value").is_key_value()
+        assert not LookupConfig("foo", {"a": "value", "b": "value"}).is_key_value()
+        assert not LookupConfig("foo", {"a": {"b": "value"}}).is_key_value()
+
+    def test_is_leaf(self):
+        assert LookupConfig("foo", "value").is_leaf
+
+        config = LookupConfig("foo", {"key": "value"})
+        assert not config.is_leaf
+        assert config.value.is_leaf
+
+    def test_is_negated(self):
+        assert not LookupConfig("foo", "value").is_negated
+
+        config = LookupConfig("foo__bar!", {"foo": {"bar": "value"}})
+        assert config.is_negated
+        assert config.value.is_negated
+        assert config.value.value.is_negated
+
     def test_as_dict(self):
         data = {"one": {"two": {"three": "value"}}}
 
@@ -101,3 +134,20 @@ def test_dictify():
             self._c = "c"
 
     assert dictify(Bar()) == {"a": "a", "b": "b"}
+
+    class Baz(Bar):
+        __slots__ = "c"
+
+    baz = Baz()
+    assert dictify(baz) == {"a": "a", "b": "b"}
+    baz.c = "c"
+    assert dictify(baz) == {"a": "a", "b": "b", "c": "c"}
+
+    class Qux(Foo):
+        d = "d"
+
+        @property
+        def e(self):
+            return "e"
+
+    assert dictify(Qux()) == {"a": "a", "b": "b", "d": "d", "e": "e"}
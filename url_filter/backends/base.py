@@ -33,7 +33,7 @@ class BaseFilterBackend(six.with_metaclass(abc.ABCMeta, object)):
     This is used by custom callable filters to define callables
     for each supported backend. More at :class:`.CallableFilter`
     """
-    supported_lookups = set()
+    supported_lookups = frozenset()
     """
     Set of supported lookups this filter backend supports.
 
@@ -57,7 +57,7 @@ class BaseFilterBackend(six.with_metaclass(abc.ABCMeta, object)):
 
     def __init__(self, queryset, context=None):
         self.queryset = queryset
-        self.context = context or {}
+        self.context = context if context is not None else {}
         self.specs = []
 
     @cached_property
@@ -71,6 +71,10 @@ class BaseFilterBackend(six.with_metaclass(abc.ABCMeta, object)):
         the model they are trying to filter matches the model the filterbackend
         got. This primarily will have misconfigurations such as using
         SQLAlchemy filterset to filter Django's ``QuerySet``.
+
+        Model is resolved lazily on first access after which it is stored
+        as a regular instance attribute hence subsequent lookups
+        do not go through the descriptor.
         """
         return self.get_model()
 
@@ -89,6 +93,9 @@ class BaseFilterBackend(six.with_metaclass(abc.ABCMeta, object)):
             backend for filtering
         """
         self.specs = specs
+        # partitioned specs are cached so they need to be recomputed
+        for name in ("regular_specs", "callable_specs"):
+            self.__dict__.pop(name, None)
 
     @cached_property
     def regular_specs(self):
@@ -101,7 +108,8 @@ class BaseFilterBackend(six.with_metaclass(abc.ABCMeta, object)):
         --------
         callable_specs
         """
-        return [i for i in self.specs if not i.is_callable]
+        # same as FilterSpec.is_callable without going through property
+        return [i for i in self.specs if i.filter_callable is None]
 
     @cached_property
     def callable_specs(self):
@@ -115,7 +123,7 @@ class BaseFilterBackend(six.with_metaclass(abc.ABCMeta, object)):
         --------
         regular_specs
         """
-        return [i for i in self.specs if i.is_callable]
+        return [i for i in self.specs if i.filter_callable is not None]
 
     @abc.abstractmethod
     def get_model(self):
@@ -133,7 +141,13 @@ class BaseFilterBackend(six.with_metaclass(abc.ABCMeta, object)):
     def filter(self):
         """
         Main public method for filtering querysets.
+
+        When no specs are bound, queryset is returned as-is
+        without calling any of the filtering methods.
         """
+        if not self.specs:
+            return self.queryset
+
         qs = self.filter_by_specs(self.queryset)
         qs = self.filter_by_callables(qs)
         return qs
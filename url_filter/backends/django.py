@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, print_function, unicode_literals
+import operator
 
+import six
 from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
 from django.db.models.constants import LOOKUP_SEP
 
 from ..utils import suppress
@@ -19,33 +22,36 @@ class DjangoFilterBackend(BaseFilterBackend):
     """
 
     name = "django"
-    supported_lookups = {
-        "contains",
-        "date",
-        "day",
-        "endswith",
-        "exact",
-        "gt",
-        "gte",
-        "hour",
-        "icontains",
-        "iendswith",
-        "iexact",
-        "in",
-        "iregex",
-        "isnull",
-        "istartswith",
-        "lt",
-        "lte",
-        "minute",
-        "month",
-        "range",
-        "regex",
-        "second",
-        "startswith",
-        "week_day",
-        "year",
-    }
+    _to_many_cache = {}
+    supported_lookups = frozenset(
+        [
+            "contains",
+            "date",
+            "day",
+            "endswith",
+            "exact",
+            "gt",
+            "gte",
+            "hour",
+            "icontains",
+            "iendswith",
+            "iexact",
+            "in",
+            "iregex",
+            "isnull",
+            "istartswith",
+            "lt",
+            "lte",
+            "minute",
+            "month",
+            "range",
+            "regex",
+            "second",
+            "startswith",
+            "week_day",
+            "year",
+        ]
+    )
 
     def empty(self):
         """
@@ -68,7 +74,7 @@ class DjangoFilterBackend(BaseFilterBackend):
         calling ``QuerySet.filter`` once rather then calling it for each
         filter specification.
         """
-        return filter(lambda i: not i.is_negated, self.regular_specs)
+        return [i for i in self.regular_specs if not i.is_negated]
 
     @property
     def excludes(self):
@@ -79,41 +85,138 @@ class DjangoFilterBackend(BaseFilterBackend):
         calling ``QuerySet.exclude`` once rather then calling it for each
         filter specification.
         """
-        return filter(lambda i: i.is_negated, self.regular_specs)
+        return [i for i in self.regular_specs if i.is_negated]
 
     def _prepare_spec(self, spec):
-        return "{}{}{}".format(
-            LOOKUP_SEP.join(spec.components), LOOKUP_SEP, spec.lookup
-        )
+        return LOOKUP_SEP.join(spec.components + (spec.lookup,))
 
     def filter_by_specs(self, queryset):
         """
         Filter queryset by applying all filter specifications
 
-        The filtering is done by calling ``QuerySet.filter`` and
-        ``QuerySet.exclude`` as appropriate.
+        The filtering is done by combining specs into a single ``Q``
+        object which is then applied with a single ``QuerySet.filter`` call.
+        Repeated and negated specs spanning to-many relations are applied
+        with separate ``QuerySet.filter`` and ``QuerySet.exclude`` calls
+        since within a single ``QuerySet.filter`` call they would have to
+        match the same related row rather than any of the related rows.
         """
-        include = {self._prepare_spec(i): i.value for i in self.includes}
-        exclude = {self._prepare_spec(i): i.value for i in self.excludes}
-
-        if include:
-            queryset = queryset.filter(**include)
-
-        # Plain queryset.exclude(**exclude) would cause exclusion of ALL
+        if not self.regular_specs:
+            return queryset
+
+        # same as using includes and excludes but in a single pass.
+        # specs are grouped by lookup since the same lookup can be
+        # repeated in querystring (e.g. ?name=a&name=b)
+        include = {}
+        exclude = {}
+        for spec in self.regular_specs:
+            lookups = exclude if spec.is_negated else include
+            lookups.setdefault(self._prepare_spec(spec), []).append(spec)
+
+        q = Q()
+        to_many_includes = []
+        for lookup, specs in include.items():
+            is_to_many = self._is_to_many_cached(self.model, specs[0].components)
+            for i, spec in enumerate(specs):
+                condition = Q(**{lookup: spec.value})
+                # repeated lookups across to-many relation can match
+                # different related rows hence they need separate filter calls
+                if i and is_to_many:
+                    to_many_includes.append(condition)
+                else:
+                    q &= condition
+
+        # Plain ~Q(**exclude) would cause exclusion of ALL
         # negative-matching objects. I.e. x!=1&y!=2 is equivalent
         # to "NOT (x = 1 AND y = 2)" SQL, which is not an intuitive behavior.
-        # We chain .exclude to achieve "NOT (x = 1) AND NOT (y = 2)" instead.
-        for lookup, value in exclude.items():
-            queryset = queryset.exclude(**{lookup: value})
+        # We negate each lookup to achieve "NOT (x = 1) AND NOT (y = 2)" instead.
+        to_many_excludes = []
+        for lookup, specs in exclude.items():
+            values = [i.value for i in specs]
+            # "NOT (x = 1) AND NOT (x = 2)" is the same as "NOT (x IN (1, 2))"
+            if len(values) > 1 and specs[0].lookup == "exact" and None not in values:
+                lookup = LOOKUP_SEP.join(specs[0].components + ("in",))
+                conditions = [Q(**{lookup: values})]
+            else:
+                conditions = [Q(**{lookup: value}) for value in values]
+
+            if self._is_to_many_cached(self.model, specs[0].components):
+                to_many_excludes.extend(conditions)
+            else:
+                for condition in conditions:
+                    q &= ~condition
+
+        if q:
+            queryset = queryset.filter(q)
+
+        for condition in to_many_includes:
+            queryset = queryset.filter(condition)
+
+        for condition in to_many_excludes:
+            queryset = queryset.exclude(condition)
+
+        return queryset.distinct() if self._is_any_to_many() else queryset
+
+    def filter_by_callables(self, queryset):
+        """
+        Filter queryset by using custom filter callables.
+
+        In addition to callables which return filtered queryset,
+        callables can be marked with ``returns_q = True`` attribute
+        in which case they should return ``Q`` object instead.
+        All ``Q`` objects are then combined and applied in a single
+        ``QuerySet.filter`` call which produces a single ``WHERE``
+        clause rather then chaining filter calls for each callable.
+        """
+        if not self.callable_specs:
+            return queryset
+
+        q_specs = []
+        other_specs = []
+        for spec in self.callable_specs:
+            if getattr(spec.filter_callable, "returns_q", False):
+                q_specs.append(spec)
+            else:
+                other_specs.append(spec)
+
+        if q_specs:
+            queryset = queryset.filter(
+                six.moves.reduce(
+                    operator.and_,
+                    (i.filter_callable(queryset=queryset, spec=i) for i in q_specs),
+                )
+            )
 
-        to_many = self._is_any_to_many()
-        return queryset.distinct() if to_many and (include or exclude) else queryset
+        for spec in other_specs:
+            queryset = spec.filter_callable(queryset=queryset, spec=spec)
+
+        return queryset
 
     def _is_any_to_many(self):
+        """
+        Check whether any of the specs spans a to-many relation
+        in which case ``QuerySet.distinct`` is required
+        since filtering can return duplicate results.
+
+        Specs filtering by local fields or by forward
+        foreign keys never need ``SELECT DISTINCT``.
+        """
         return any(
-            self._is_to_many(self.model, i.components) for i in self.regular_specs
+            self._is_to_many_cached(self.model, i.components)
+            for i in self.regular_specs
         )
 
+    def _is_to_many_cached(self, model, components):
+        # model relations are static so result can be reused across requests
+        key = (model, components)
+        try:
+            return self._to_many_cache[key]
+        except KeyError:
+            is_to_many = self._to_many_cache[key] = bool(
+                self._is_to_many(model, components)
+            )
+            return is_to_many
+
     def _is_to_many(self, model, components):
         if not components:
             return False
@@ -2,10 +2,154 @@
 from __future__ import absolute_import, print_function, unicode_literals
 import re
 
+import six
+
 from ..utils import dictify
 from .base import BaseFilterBackend
 
 
+LOOKUP_COST = {
+    "contains": 1,
+    "endswith": 1,
+    "icontains": 2,
+    "iendswith": 2,
+    "iexact": 2,
+    "iin": 2,
+    "istartswith": 2,
+    "startswith": 1,
+    "iregex": 3,
+    "regex": 3,
+}
+"""
+Relative cost of comparing values by lookup. Lookups which are not
+present are cheap comparisons such as ``exact``. Used to order specs
+so that cheap comparisons are done first in order to short-circuit
+expensive ones.
+"""
+
+
+class _LowercaseValues(frozenset):
+    """
+    Values of ``iin`` spec which are already lowercased
+    by :meth:`PlainFilterBackend._compile_spec`.
+    """
+
+
+def _compare_contains(value, spec):
+    return spec.value in value
+
+
+def _compare_day(value, spec):
+    return value.day == spec.value
+
+
+def _compare_endswith(value, spec):
+    return value.endswith(spec.value)
+
+
+def _compare_exact(value, spec):
+    return value == spec.value
+
+
+def _compare_gt(value, spec):
+    return value > spec.value
+
+
+def _compare_gte(value, spec):
+    return value >= spec.value
+
+
+def _compare_hour(value, spec):
+    return value.hour == spec.value
+
+
+def _compare_icontains(value, spec):
+    return spec.value.lower() in value.lower()
+
+
+def _compare_iendswith(value, spec):
+    return value.lower().endswith(spec.value.lower())
+
+
+def _compare_iexact(value, spec):
+    return value.lower() == spec.value.lower()
+
+
+def _compare_in(value, spec):
+    try:
+        return value in spec.value
+    except TypeError:
+        # unhashable value cannot be looked up in prebuilt frozenset
+        return any(value == i for i in spec.value)
+
+
+def _compare_iin(value, spec):
+    if isinstance(spec.value, _LowercaseValues):
+        return value.lower() in spec.value
+    return value.lower() in [i.lower() for i in spec.value]
+
+
+def _compare_iregex(value, spec):
+    if isinstance(spec.value, six.string_types):
+        return bool(re.match(spec.value, value, re.IGNORECASE))
+    # pattern is compiled with IGNORECASE in PlainFilterBackend._compile_spec
+    return bool(spec.value.match(value))
+
+
+def _compare_isnull(value, spec):
+    if spec.value:
+        return value is None
+    else:
+        return value is not None
+
+
+def _compare_istartswith(value, spec):
+    return value.lower().startswith(spec.value.lower())
+
+
+def _compare_lt(value, spec):
+    return value < spec.value
+
+
+def _compare_lte(value, spec):
+    return value <= spec.value
+
+
+def _compare_minute(value, spec):
+    return value.minute == spec.value
+
+
+def _compare_month(value, spec):
+    return value.month == spec.value
+
+
+def _compare_range(value, spec):
+    return spec.value[0] <= value <= spec.value[1]
+
+
+def _compare_regex(value, spec):
+    if isinstance(spec.value, six.string_types):
+        return bool(re.match(spec.value, value))
+    return bool(spec.value.match(value))
+
+
+def _compare_second(value, spec):
+    return value.second == spec.value
+
+
+def _compare_startswith(value, spec):
+    return value.startswith(spec.value)
+
+
+def _compare_week_day(value, spec):
+    # expected 1-Sunday and 7-Saturday
+    return ((value.weekday() + 1) % 7) + 1 == spec.value
+
+
+def _compare_year(value, spec):
+    return value.year == spec.value
+
+
 class PlainFilterBackend(BaseFilterBackend):
     """
     Filter backend for filtering plain Python iterables.
@@ -20,33 +164,35 @@ class PlainFilterBackend(BaseFilterBackend):
 
     name = "plain"
     enforce_same_models = False
-    supported_lookups = {
-        "contains",
-        "day",
-        "endswith",
-        "exact",
-        "gt",
-        "gte",
-        "hour",
-        "icontains",
-        "iendswith",
-        "iexact",
-        "iin",
-        "in",
-        "iregex",
-        "isnull",
-        "istartswith",
-        "lt",
-        "lte",
-        "minute",
-        "month",
-        "range",
-        "regex",
-        "second",
-        "startswith",
-        "week_day",
-        "year",
-    }
+    supported_lookups = frozenset(
+        [
+            "contains",
+            "day",
+            "endswith",
+            "exact",
+            "gt",
+            "gte",
+            "hour",
+            "icontains",
+            "iendswith",
+            "iexact",
+            "iin",
+            "in",
+            "iregex",
+            "isnull",
+            "istartswith",
+            "lt",
+            "lte",
+            "minute",
+            "month",
+            "range",
+            "regex",
+            "second",
+            "startswith",
+            "week_day",
+            "year",
+        ]
+    )
 
     def empty(self):
         """
@@ -74,112 +220,151 @@ class PlainFilterBackend(BaseFilterBackend):
         if not self.regular_specs:
             return queryset
 
-        return list(filter(self._filter_callable, queryset))
-
-    def _filter_callable(self, item):
-        return all(self._filter_by_spec(item, spec) for spec in self.regular_specs)
-
-    def _filter_by_spec(self, item, spec):
-        filtered = self._filter_by_spec_and_value(item, spec.components, spec)
-        if spec.is_negated:
-            return not filtered
-        return filtered
-
-    def _filter_by_spec_and_value(self, item, components, spec):
-        if not components and not isinstance(item, (list, tuple)):
-            comparator = getattr(self, "_compare_{}".format(spec.lookup))
-            try:
-                return comparator(item, spec)
-            except Exception:
-                return True
+        return list(filter(self._build_predicate(), queryset))
 
-        if isinstance(item, (list, tuple)):
-            return any(
-                self._filter_by_spec_and_value(i, components, spec) for i in item
-            )
-
-        if not isinstance(item, dict):
-            item = dictify(item)
+    def _build_predicate(self):
+        """
+        Build a single predicate function which checks whether an item
+        matches all filter specifications.
 
-        return self._filter_by_spec_and_value(
-            item.get(components[0], {}), components[1:], spec
+        All specs are prepared (see :meth:`._compile_spec`) and
+        comparators are resolved only once.
+        Specs are ordered so that cheaper lookups are checked first
+        since the predicate stops on first non-matching spec.
+        """
+        specs = sorted(
+            map(self._compile_spec, self.regular_specs),
+            key=lambda i: LOOKUP_COST.get(i.lookup, 0),
         )
+        checks = [
+            (spec.components, spec.is_negated, spec, self._get_comparator(spec))
+            for spec in specs
+        ]
+        filter_by_spec_and_value = self._filter_by_spec_and_value
+
+        # objects are converted to dicts only once per item
+        # even when multiple specs traverse the same objects.
+        # object itself is stored in the cache as well so that
+        # its id cannot be reused while the cache is in use
+        cache = {}
+
+        def cached_dictify(obj):
+            try:
+                return cache[id(obj)][1]
+            except KeyError:
+                data = dictify(obj)
+                cache[id(obj)] = (obj, data)
+                return data
+
+        def predicate(item):
+            cache.clear()
+            for components, is_negated, spec, comparator in checks:
+                matched = filter_by_spec_and_value(
+                    item, components, spec, comparator, cached_dictify
+                )
+                if is_negated:
+                    matched = not matched
+                if not matched:
+                    return False
+            return True
+
+        return predicate
+
+    def _get_comparator(self, spec):
+        """
+        Get comparator method for the spec lookup.
 
-    def _compare_contains(self, value, spec):
-        return spec.value in value
-
-    def _compare_day(self, value, spec):
-        return value.day == spec.value
-
-    def _compare_endswith(self, value, spec):
-        return value.endswith(spec.value)
-
-    def _compare_exact(self, value, spec):
-        return value == spec.value
-
-    def _compare_gt(self, value, spec):
-        return value > spec.value
-
-    def _compare_gte(self, value, spec):
-        return value >= spec.value
-
-    def _compare_hour(self, value, spec):
-        return value.hour == spec.value
-
-    def _compare_icontains(self, value, spec):
-        return spec.value.lower() in value.lower()
-
-    def _compare_iendswith(self, value, spec):
-        return value.lower().endswith(spec.value.lower())
-
-    def _compare_iexact(self, value, spec):
-        return value.lower() == spec.value.lower()
-
-    def _compare_in(self, value, spec):
-        return value in spec.value
-
-    def _compare_iin(self, value, spec):
-        return value.lower() in [i.lower() for i in spec.value]
-
-    def _compare_iregex(self, value, spec):
-        return bool(re.match(spec.value, value, re.IGNORECASE))
-
-    def _compare_isnull(self, value, spec):
-        if spec.value:
-            return value is None
-        else:
-            return value is not None
-
-    def _compare_istartswith(self, value, spec):
-        return value.lower().startswith(spec.value.lower())
-
-    def _compare_lt(self, value, spec):
-        return value < spec.value
-
-    def _compare_lte(self, value, spec):
-        return value <= spec.value
-
-    def _compare_minute(self, value, spec):
-        return value.minute == spec.value
-
-    def _compare_month(self, value, spec):
-        return value.month == spec.value
-
-    def _compare_range(self, value, spec):
-        return spec.value[0] <= value <= spec.value[1]
-
-    def _compare_regex(self, value, spec):
-        return bool(re.match(spec.value, value))
-
-    def _compare_second(self, value, spec):
-        return value.second == spec.value
-
-    def _compare_startswith(self, value, spec):
-        return value.startswith(spec.value)
+        Comparator is looked up once per spec rather than for each
+        compared value. Default comparators are static methods
+        so no bound method is created per comparison however
+        subclasses can still overwrite any of them with regular methods.
+        """
+        return getattr(self, "_compare_{}".format(spec.lookup))
 
-    def _compare_week_day(self, value, spec):
-        # expected 1-Sunday and 7-Saturday
-        return ((value.weekday() + 1) % 7) + 1 == spec.value
+    def _compile_spec(self, spec):
+        """
+        Precompute spec value so that it does not have to be recomputed
+        while comparing each individual item within the iterable.
+        For example regex patterns are compiled only once
+        and ``in``/``iin`` lookups use a set for membership tests.
 
-    def _compare_year(self, value, spec):
-        return value.year == spec.value
+        Comparators accept both compiled and not compiled specs.
+        When a value cannot be compiled, the spec is returned as is.
+        """
+        if spec.lookup == "in":
+            try:
+                return spec._replace(value=frozenset(spec.value))
+            except TypeError:
+                # unhashable values are compared one by one
+                pass
+        elif spec.lookup == "iin":
+            try:
+                return spec._replace(
+                    value=_LowercaseValues(i.lower() for i in spec.value)
+                )
+            except (AttributeError, TypeError):
+                pass
+        elif spec.lookup in ("regex", "iregex"):
+            flags = re.IGNORECASE if spec.lookup == "iregex" else 0
+            try:
+                return spec._replace(value=re.compile(spec.value, flags))
+            except (re.error, TypeError):
+                # invalid pattern fails each comparison as before
+                pass
+        return spec
+
+    def _filter_by_spec_and_value(
+        self, item, components, spec, comparator, to_dict=dictify
+    ):
+        # components are traversed in a loop and recursion is only used
+        # to check all items of a list/tuple
+        index = 0
+        n_components = len(components)
+
+        while True:
+            if isinstance(item, (list, tuple)):
+                remaining = components[index:]
+                return any(
+                    self._filter_by_spec_and_value(
+                        i, remaining, spec, comparator, to_dict
+                    )
+                    for i in item
+                )
+
+            if index == n_components:
+                try:
+                    return comparator(item, spec)
+                except Exception:
+                    return True
+
+            if not isinstance(item, dict):
+                item = to_dict(item)
+
+            item = item.get(components[index], {})
+            index += 1
+
+    _compare_contains = staticmethod(_compare_contains)
+    _compare_day = staticmethod(_compare_day)
+    _compare_endswith = staticmethod(_compare_endswith)
+    _compare_exact = staticmethod(_compare_exact)
+    _compare_gt = staticmethod(_compare_gt)
+    _compare_gte = staticmethod(_compare_gte)
+    _compare_hour = staticmethod(_compare_hour)
+    _compare_icontains = staticmethod(_compare_icontains)
+    _compare_iendswith = staticmethod(_compare_iendswith)
+    _compare_iexact = staticmethod(_compare_iexact)
+    _compare_in = staticmethod(_compare_in)
+    _compare_iin = staticmethod(_compare_iin)
+    _compare_iregex = staticmethod(_compare_iregex)
+    _compare_isnull = staticmethod(_compare_isnull)
+    _compare_istartswith = staticmethod(_compare_istartswith)
+    _compare_lt = staticmethod(_compare_lt)
+    _compare_lte = staticmethod(_compare_lte)
+    _compare_minute = staticmethod(_compare_minute)
+    _compare_month = staticmethod(_compare_month)
+    _compare_range = staticmethod(_compare_range)
+    _compare_regex = staticmethod(_compare_regex)
+    _compare_second = staticmethod(_compare_second)
+    _compare_startswith = staticmethod(_compare_startswith)
+    _compare_week_day = staticmethod(_compare_week_day)
+    _compare_year = staticmethod(_compare_year)
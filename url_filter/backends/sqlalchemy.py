@@ -3,7 +3,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 import itertools
 
 from sqlalchemy import false, func
-from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm import RelationshipProperty, class_mapper
 from sqlalchemy.sql.expression import not_
 
 from .base import BaseFilterBackend
@@ -36,24 +36,27 @@ class SQLAlchemyFilterBackend(BaseFilterBackend):
     """
 
     name = "sqlalchemy"
-    supported_lookups = {
-        "contains",
-        "endswith",
-        "exact",
-        "gt",
-        "gte",
-        "icontains",
-        "iendswith",
-        "iexact",
-        "iin",
-        "in",
-        "isnull",
-        "istartswith",
-        "lt",
-        "lte",
-        "range",
-        "startswith",
-    }
+    _properties_cache = {}
+    supported_lookups = frozenset(
+        [
+            "contains",
+            "endswith",
+            "exact",
+            "gt",
+            "gte",
+            "icontains",
+            "iendswith",
+            "iexact",
+            "iin",
+            "in",
+            "isnull",
+            "istartswith",
+            "lt",
+            "lte",
+            "range",
+            "startswith",
+        ]
+    )
 
     def __init__(self, *args, **kwargs):
         super(SQLAlchemyFilterBackend, self).__init__(*args, **kwargs)
@@ -87,9 +90,20 @@ class SQLAlchemyFilterBackend(BaseFilterBackend):
         if not self.regular_specs:
             return queryset
 
-        clauses = [self.build_clause(spec) for spec in self.regular_specs]
-        conditions, joins = zip(*clauses)
-        joins = list(itertools.chain(*joins))
+        conditions = []
+        joins = []
+        # multiple specs can go through the same relations
+        # however each relation should only be joined once.
+        # attributes are compared by id since instrumented
+        # attributes overload comparison operators
+        joined_ids = set()
+        for spec in self.regular_specs:
+            condition, to_join = self.build_clause(spec)
+            conditions.append(condition)
+            for attr in to_join:
+                if id(attr) not in joined_ids:
+                    joined_ids.add(id(attr))
+                    joins.append(attr)
 
         if joins:
             queryset = queryset.join(*joins)
@@ -119,14 +133,11 @@ class SQLAlchemyFilterBackend(BaseFilterBackend):
 
         model = self.model
         for component in spec.components:
-            _field = getattr(model, component)
             field = self._get_properties_for_model(model)[component]
-            try:
-                model = self._get_related_model_for_field(field)
-            except AttributeError:
+            if not isinstance(field, RelationshipProperty):
                 break
-            else:
-                to_join.append(_field)
+            to_join.append(getattr(model, component))
+            model = self._get_related_model_for_field(field)
 
         # cant directly compare instrumented attributes
         # so need to collect object ids which are unique
@@ -213,9 +224,18 @@ class SQLAlchemyFilterBackend(BaseFilterBackend):
         Get column properties dict for the given model where
         keys are field names and values are column properties
         (e.g. ``ColumnProperty``) or related classes.
+
+        Mapper properties do not change once mappers are configured
+        hence properties are computed once per model.
         """
-        mapper = class_mapper(model)
-        return {i.key: i for i in mapper.iterate_properties}
+        try:
+            return cls._properties_cache[model]
+        except KeyError:
+            mapper = class_mapper(model)
+            properties = cls._properties_cache[model] = {
+                i.key: i for i in mapper.iterate_properties
+            }
+            return properties
 
     @classmethod
     def _get_column_for_field(cls, field):
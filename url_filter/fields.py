@@ -6,6 +6,13 @@ from django import forms
 from .validators import MaxLengthValidator, MinLengthValidator
 
 
+FAST_CONVERTERS = {forms.IntegerField: int, forms.FloatField: float}
+"""
+Form fields which values can be converted directly by using
+builtin type without going through the form field ``clean``.
+"""
+
+
 class MultipleValuesField(forms.CharField):
     """
     Custom Django field for validating/cleaning multiple
@@ -57,6 +64,12 @@ class MultipleValuesField(forms.CharField):
         if max_values:
             self.many_validators.append(MaxLengthValidator(max_values))
 
+    def __deepcopy__(self, memo):
+        result = super(MultipleValuesField, self).__deepcopy__(memo)
+        result.child = self.child.__deepcopy__(memo)
+        result.many_validators = self.many_validators[:]
+        return result
+
     def clean(self, value):
         """
         Custom ``clean`` which first validates the value first by using
@@ -81,14 +94,38 @@ class MultipleValuesField(forms.CharField):
         Method responsible to split the value into multiple
         values by using the delimiter and cleaning each one
         as per the child field.
+
+        When child field is a plain ``IntegerField`` or ``FloatField``
+        without any validators, all values are converted at once
+        without going through child field ``clean`` for each value.
+        If any of the values cannot be converted, each value is cleaned
+        by the child field as usual so that appropriate errors are raised.
         """
+        parts = value.split(self.delimiter)
+
+        child = self.child
+        fast_type = FAST_CONVERTERS.get(type(child))
+        if fast_type and not child.validators and not child.localize:
+            try:
+                values = [fast_type(i) for i in parts]
+            except ValueError:
+                pass
+            else:
+                # FloatField does not allow nan or infinity
+                # which are the only values for which "i - i" is not 0
+                if all(i - i == 0 for i in values):
+                    return values
+
+        clean = child.clean
+        if self.all_valid:
+            return [clean(i) for i in parts]
+
         values = []
-        for i in value.split(self.delimiter):
+        for i in parts:
             try:
-                values.append(self.child.clean(i))
+                values.append(clean(i))
             except forms.ValidationError:
-                if self.all_valid:
-                    raise
+                pass
         return values
 
     def many_validate(self, values):
@@ -107,15 +144,18 @@ class MultipleValuesField(forms.CharField):
         if not values:
             return
 
-        errors = []
+        error_messages = self.error_messages
+        # errors are only collected when any validator fails
+        errors = None
         for v in self.many_validators:
             try:
                 v(values)
             except forms.ValidationError as e:
-                if hasattr(e, "code") and e.code in self.error_messages:
-                    e = forms.ValidationError(
-                        self.error_messages[e.code], e.code, e.params
-                    )
+                code = getattr(e, "code", None)
+                if code in error_messages:
+                    e = forms.ValidationError(error_messages[code], code, e.params)
+                if errors is None:
+                    errors = []
                 errors.extend(e.error_list)
         if errors:
             raise forms.ValidationError(errors)
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, print_function, unicode_literals
 import abc
+import inspect
 import re
-from functools import wraps
+from weakref import WeakKeyDictionary
 
 import six
 from cached_property import cached_property
@@ -39,6 +40,8 @@ LOOKUP_CALLABLE_FROM_METHOD_REGEX = re.compile(
     r"^filter_(?P<filter>[\w\d]+)_for_(?P<backend>[\w\d]+)$"
 )
 
+_CUSTOM_LOOKUPS_CACHE = WeakKeyDictionary()
+
 
 class BaseFilter(six.with_metaclass(abc.ABCMeta, object)):
     """
@@ -70,6 +73,8 @@ class BaseFilter(six.with_metaclass(abc.ABCMeta, object)):
 
     def __init__(self, source=None, *args, **kwargs):
         self._source = source
+        self._components = None
+        self._root = None
         self.parent = None
         self.name = None
         self.is_bound = False
@@ -126,9 +131,26 @@ class BaseFilter(six.with_metaclass(abc.ABCMeta, object)):
         """
         List of all components (source names) of all parent filtersets.
         """
+        return list(self._get_components())
+
+    def _get_components(self):
+        """
+        Get tuple of all components which is computed once
+        and cached until the filter is bound again.
+        """
         if self.parent is None:
-            return []
-        return self.parent.components + [self.source]
+            return ()
+        if self._components is None:
+            self._components = self.parent._get_components() + (self.source,)
+        return self._components
+
+    def _reset_bind_cache(self):
+        """
+        Reset cached components and root so that they are recomputed
+        on next access.
+        """
+        self._components = None
+        self._root = None
 
     def bind(self, name, parent):
         """
@@ -141,15 +163,20 @@ class BaseFilter(six.with_metaclass(abc.ABCMeta, object)):
         self.name = name
         self.parent = parent
         self.is_bound = True
+        self._reset_bind_cache()
 
     @property
     def root(self):
         """
         This gets the root filterset.
+
+        Root is computed once and cached until the filter is bound again.
         """
         if self.parent is None:
             return self
-        return self.parent.root
+        if self._root is None:
+            self._root = self.parent.root
+        return self._root
 
 
 class Filter(BaseFilter):
@@ -236,6 +263,7 @@ class Filter(BaseFilter):
         self.default_lookup = default_lookup or self.default_lookup
         self.is_default = is_default
         self.no_lookup = no_lookup
+        self._many_form_fields = {}
 
     def repr(self, prefix=""):
         """
@@ -296,10 +324,10 @@ class Filter(BaseFilter):
           use empty set as supported lookups
         """
         if self._given_lookups:
-            return set(self._given_lookups)
+            return frozenset(self._given_lookups)
         if hasattr(self.root, "filter_backend"):
             return self.root.filter_backend.supported_lookups
-        return set()
+        return frozenset()
 
     def get_form_field(self, lookup):
         """
@@ -320,17 +348,23 @@ class Filter(BaseFilter):
         -------
         Field
             Instantiated form field appropriate for the given lookup.
+            Form fields for lookups with multiple values are instantiated
+            once and then reused for subsequent calls.
         """
-        if lookup in MANY_LOOKUP_FIELD_OVERWRITES:
-            return MANY_LOOKUP_FIELD_OVERWRITES[lookup](
-                child=self.form_field,
-                all_valid=getattr(self.root, "strict_mode", StrictMode.fail)
-                == StrictMode.fail,
+        field_class = MANY_LOOKUP_FIELD_OVERWRITES.get(lookup)
+        if field_class is not None:
+            all_valid = (
+                getattr(self.root, "strict_mode", StrictMode.fail) == StrictMode.fail
             )
-        elif lookup in LOOKUP_FIELD_OVERWRITES:
-            return LOOKUP_FIELD_OVERWRITES[lookup]
-        else:
-            return self.form_field
+            key = (lookup, all_valid, self.form_field)
+            try:
+                return self._many_form_fields[key]
+            except KeyError:
+                form_field = field_class(child=self.form_field, all_valid=all_valid)
+                self._many_form_fields[key] = form_field
+                return form_field
+
+        return LOOKUP_FIELD_OVERWRITES.get(lookup, self.form_field)
 
     def clean_value(self, value, lookup):
         """
@@ -351,6 +385,27 @@ class Filter(BaseFilter):
         form_field = self.get_form_field(lookup)
         return form_field.clean(value)
 
+    def _get_explicit_lookup_and_value(self, config):
+        """
+        Get lookup and value from the config when lookup
+        was explicitly provided in the lookup key.
+        """
+        if not config.is_key_value():
+            raise ValidationError(
+                "Invalid filtering data provided. "
+                "Data is more complex then expected. "
+                "Most likely additional lookup was specified "
+                "after the final lookup (e.g. field__in__equal=value)."
+            )
+
+        if self.no_lookup:
+            raise ValidationError(
+                "Lookup was explicit used in filter specification. "
+                "This filter does not allow to specify lookup."
+            )
+
+        return config.name, config.value.data
+
     def get_spec(self, config):
         """
         Get the ``FilterSpec`` for the provided ``config``.
@@ -368,23 +423,8 @@ class Filter(BaseFilter):
             spec constructed from the given configuration.
         """
         # lookup was explicitly provided
-        if isinstance(config.data, dict):
-            if not config.is_key_value():
-                raise ValidationError(
-                    "Invalid filtering data provided. "
-                    "Data is more complex then expected. "
-                    "Most likely additional lookup was specified "
-                    "after the final lookup (e.g. field__in__equal=value)."
-                )
-
-            if self.no_lookup:
-                raise ValidationError(
-                    "Lookup was explicit used in filter specification. "
-                    "This filter does not allow to specify lookup."
-                )
-
-            lookup = config.name
-            value = config.value.data
+        if not config.is_leaf:
+            lookup, value = self._get_explicit_lookup_and_value(config)
 
         # use default lookup
         else:
@@ -394,10 +434,9 @@ class Filter(BaseFilter):
         if lookup not in self.lookups:
             raise ValidationError('"{}" lookup is not supported'.format(lookup))
 
-        is_negated = "!" in config.key
         value = self.clean_value(value, lookup)
 
-        return FilterSpec(self.components, lookup, value, is_negated)
+        return FilterSpec(self._get_components(), lookup, value, config.is_negated)
 
 
 def form_field_for_filter(form_field):
@@ -427,13 +466,10 @@ def form_field_for_filter(form_field):
     """
 
     def wrapper(f):
-        @wraps(f)
-        def inner(self, *args, **kwargs):
-            return f(self, *args, **kwargs)
-
-        inner.form_field = form_field
-
-        return inner
+        # form field is set directly on the function
+        # so that calling filter callable does not go through extra wrapper
+        f.form_field = form_field
+        return f
 
     return wrapper
 
@@ -486,6 +522,12 @@ class CallableFilter(Filter):
         when ``form_field`` parameter is not provided, all custom
         filter callables should define their own appropriate form fields
         by using :func:`.form_field_for_filter`.
+
+    .. note::
+        Django filter callables can set ``returns_q = True`` attribute
+        on the method in which case they should return ``Q`` object
+        instead of filtered queryset. See
+        :meth:`.DjangoFilterBackend.filter_by_callables`.
     """
 
     def __init__(self, form_field=None, *args, **kwargs):
@@ -502,15 +544,45 @@ class CallableFilter(Filter):
         set of supported lookups as returned by the super implementation.
         """
         lookups = super(CallableFilter, self).lookups
+        custom_lookups = self._get_custom_lookups().get(self.root.filter_backend.name)
+        # avoid copying shared backend lookups when there is nothing to add
+        if not custom_lookups:
+            return lookups
+        return lookups | custom_lookups
 
-        r = LOOKUP_CALLABLE_FROM_METHOD_REGEX
-        custom_lookups = {
-            m.groupdict()["filter"]
-            for m in (r.match(i) for i in dir(self))
-            if m and m.groupdict()["backend"] == self.root.filter_backend.name
-        }
+    @classmethod
+    def _get_custom_lookups(cls):
+        """
+        Get custom lookups defined by filter callable methods
+        grouped by backend name.
 
-        return lookups | custom_lookups
+        Methods are defined on the class hence they are only
+        looked up once per class.
+        """
+        try:
+            return _CUSTOM_LOOKUPS_CACHE[cls]
+        except KeyError:
+            pass
+
+        names = set()
+        for klass in inspect.getmro(cls):
+            names.update(vars(klass))
+
+        custom_lookups = {}
+        for name in names:
+            # cheap check before matching regex
+            if not name.startswith("filter_"):
+                continue
+            m = LOOKUP_CALLABLE_FROM_METHOD_REGEX.match(name)
+            if m:
+                custom_lookups.setdefault(m.group("backend"), set()).add(
+                    m.group("filter")
+                )
+
+        custom_lookups = _CUSTOM_LOOKUPS_CACHE[cls] = {
+            k: frozenset(v) for k, v in custom_lookups.items()
+        }
+        return custom_lookups
 
     def _get_filter_method_for_lookup(self, lookup):
         name = "filter_{}_for_{}".format(lookup, self.root.filter_backend.name)
@@ -553,5 +625,6 @@ class CallableFilter(Filter):
         when the lookup is a custom lookup
         """
         spec = super(CallableFilter, self).get_spec(config)
-        spec.filter_callable = self._get_filter_method_for_lookup(spec.lookup)
-        return spec
+        return spec._replace(
+            filter_callable=self._get_filter_method_for_lookup(spec.lookup)
+        )
@@ -10,7 +10,7 @@ from cached_property import cached_property
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from django.db.models.constants import LOOKUP_SEP
-from django.http import QueryDict
+from django.utils.datastructures import MultiValueDict
 
 from ..backends.django import DjangoFilterBackend
 from ..constants import StrictMode
@@ -78,9 +78,18 @@ class FilterSetMeta(type(BaseFilter)):
         if not parents:
             return new_class
 
+        # filtersets already collected filters of all of their bases
+        # so only other classes (e.g. mixins) need to be scanned.
+        # reversed MRO makes sure that closer bases take precedence
         filters = {}
-        for base in [vars(base) for base in bases] + [attrs]:
-            filters.update({k: v for k, v in base.items() if isinstance(v, BaseFilter)})
+        for base in reversed(new_class.__mro__):
+            base_attrs = vars(base)
+            if base is not new_class and "_declared_filters" in base_attrs:
+                filters.update(base_attrs["_declared_filters"])
+            else:
+                filters.update(
+                    {k: v for k, v in base_attrs.items() if isinstance(v, BaseFilter)}
+                )
 
         new_class._declared_filters = filters
         new_class.Meta = new_class.filter_options_class(
@@ -110,6 +119,9 @@ class FilterSet(six.with_metaclass(FilterSetMeta, BaseFilter)):
     ----------
     data : QueryDict, optional
         ``QueryDict`` of querystring data.
+        Any other ``MultiValueDict`` is accepted as well
+        which avoids constructing ``QueryDict`` when the data
+        is already parsed.
         Only optional when :class:`.FilterSet` is used as a nested filter
         within another :class:`.FilterSet`.
     queryset : iterable, optional
@@ -148,7 +160,7 @@ class FilterSet(six.with_metaclass(FilterSetMeta, BaseFilter)):
         super(FilterSet, self).__init__(*args, **kwargs)
         self.data = data
         self.queryset = queryset
-        self.context = context or {}
+        self.context = context if context is not None else {}
         self.strict_mode = strict_mode or self.default_strict_mode
 
     def repr(self, prefix=""):
@@ -176,6 +188,18 @@ class FilterSet(six.with_metaclass(FilterSetMeta, BaseFilter)):
         ]
         return "\n".join(lines)
 
+    def _reset_bind_cache(self):
+        """
+        Reset cached components and root of this filterset as well as all
+        of its already bound children filters since their components
+        and root depend on this filterset.
+        """
+        super(FilterSet, self)._reset_bind_cache()
+        # only reset filters when they were already computed
+        if "filters" in self.__dict__:
+            for _filter in self.filters.values():
+                _filter._reset_bind_cache()
+
     def get_filters(self):
         """
         Get all filters defined in this filterset.
@@ -243,7 +267,13 @@ class FilterSet(six.with_metaclass(FilterSetMeta, BaseFilter)):
         key : str
             Key as provided in the querystring
         """
-        filter_key_validator(key)
+        # same as calling filter_key_validator(key)
+        # but without going through generic RegexValidator machinery
+        # since this is called for every key in the querystring
+        if not LOOKUP_RE.search(key):
+            raise ValidationError(
+                FilterKeyValidator.message, code=FilterKeyValidator.code
+            )
 
     def get_filter_backend(self):
         """
@@ -283,6 +313,11 @@ class FilterSet(six.with_metaclass(FilterSetMeta, BaseFilter)):
         * instantiates filter backend
         * uses the created filter specs to filter queryset by using specs
 
+        When getting specs signals that result should be empty
+        (see ``StrictMode.empty``), backend empty queryset
+        is returned right away without doing any filtering
+        including custom filter callables.
+
         Returns
         -------
         querystring
@@ -291,8 +326,8 @@ class FilterSet(six.with_metaclass(FilterSetMeta, BaseFilter)):
         assert self.root is self, "``filter`` can only be called on root ``FilterSet``."
         assert self.queryset is not None, "``queryset`` was not passed for filtering."
         assert isinstance(
-            self.data, QueryDict
-        ), "``data`` should be an instance of QueryDict."
+            self.data, MultiValueDict
+        ), "``data`` should be an instance of QueryDict or MultiValueDict."
 
         try:
             specs = self.get_specs()
@@ -368,13 +403,13 @@ class FilterSet(six.with_metaclass(FilterSetMeta, BaseFilter)):
         FilterSpec
             Individual filter spec
         """
-        if isinstance(config.data, dict):
+        if not config.is_leaf:
             name, value = config.name, config.value
         else:
             if self.default_filter is None:
                 raise SkipFilter
             name = self.default_filter.source
-            value = LookupConfig(config.key, config.data)
+            value = LookupConfig(config.key, config.data, config.is_negated)
 
         if name not in self.filters:
             if self.default_filter and self is not self.root:
@@ -394,14 +429,14 @@ class FilterSet(six.with_metaclass(FilterSetMeta, BaseFilter)):
         Generate ``LookupConfig``s for all data in querystring data.
         """
         for key, values in self.data.lists():
+            # key is the same for all of its values
+            # hence it is only parsed once
+            components = key.replace("!", "").split(LOOKUP_SEP)[::-1]
             for value in values:
-                yield LookupConfig(
-                    key,
-                    six.moves.reduce(
-                        lambda a, b: {b: a},
-                        (key.replace("!", "").split(LOOKUP_SEP) + [value])[::-1],
-                    ),
-                )
+                data = value
+                for component in components:
+                    data = {component: data}
+                yield LookupConfig(key, data)
 
 
 class ModelFilterSetOptions(FilterSetOptions):
@@ -94,7 +94,8 @@ class SQLAlchemyModelFilterSet(BaseModelFilterSet):
         fields by simply doing a dictionary lookup instead of requiring
         search operations to find appropriate properties.
         """
-        return SQLAlchemyFilterBackend._get_properties_for_model(self.Meta.model)
+        # copy since cached properties are shared between filtersets
+        return dict(SQLAlchemyFilterBackend._get_properties_for_model(self.Meta.model))
 
     def _get_model_field_names(self):
         """
@@ -8,6 +8,26 @@ from rest_framework.filters import BaseFilterBackend
 from ..filtersets import ModelFilterSet
 
 
+def _freeze(value):
+    """
+    Recursively convert value to a hashable value so that the value
+    can be used as part of a cache key.
+
+    Each value is tagged with its type so that values which are
+    equal but have different types (e.g. ``{"a": 1}`` and ``[("a", 1)]``)
+    produce different keys.
+    """
+    if isinstance(value, dict):
+        frozen = tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, (set, frozenset)):
+        frozen = frozenset(_freeze(i) for i in value)
+    elif isinstance(value, (list, tuple)):
+        frozen = tuple(_freeze(i) for i in value)
+    else:
+        frozen = value
+    return type(value), frozen
+
+
 class DjangoFilterBackend(BaseFilterBackend):
     """
     DRF filter backend which integrates with ``django-url-filter``
@@ -56,6 +76,7 @@ class DjangoFilterBackend(BaseFilterBackend):
     """
     Default base class which will be used while dynamically creating :class:`.FilterSet`
     """
+    _filter_class_cache = {}
 
     def get_filter_class(self, view, queryset=None):
         """
@@ -79,6 +100,14 @@ class DjangoFilterBackend(BaseFilterBackend):
         None
             When appropriate :class:`.FilterSet` cannot be determined
             for filtering
+
+        .. note::
+            Dynamically constructed :class:`.FilterSet` classes are cached
+            per view class, model and filter configuration so that
+            the class is only created once instead of on every request.
+            The cache is shared by the whole process and is not bounded
+            in size hence views which change ``filter_fields`` or
+            ``filter_class_meta_kwargs`` per request will keep growing it.
         """
         filter_class_default = getattr(
             view, "filter_class_default", self.default_filter_set
@@ -93,16 +122,36 @@ class DjangoFilterBackend(BaseFilterBackend):
         if filter_fields:
             model = filter_class_default.filter_backend_class(queryset).get_model()
 
+            try:
+                cache_key = (
+                    type(view),
+                    filter_class_default,
+                    model,
+                    _freeze(filter_fields),
+                    _freeze(filter_class_meta_kwargs),
+                )
+                return self._filter_class_cache[cache_key]
+            except KeyError:
+                pass
+            except TypeError:
+                # unhashable or unsortable meta kwargs so class cannot be cached
+                cache_key = None
+
             meta_kwargs = filter_class_meta_kwargs.copy()
             meta_kwargs.update({"model": model, "fields": filter_fields})
             meta = type(str("Meta"), (object,), meta_kwargs)
 
-            return type(
+            filter_class = type(
                 str("{}FilterSet".format(model.__name__)),
                 (filter_class_default,),
                 {"Meta": meta},
             )
 
+            if cache_key is not None:
+                self._filter_class_cache[cache_key] = filter_class
+
+            return filter_class
+
     def get_filter_context(self, request, view):
         """
         Get context to be passed to :class:`.FilterSet` during initialization
@@ -139,7 +188,12 @@ class DjangoFilterBackend(BaseFilterBackend):
         object
             Filtered query object if filtering class was determined by
             :meth:`.get_filter_class`. If not given ``queryset`` is returned.
+            Same is true when request does not have any querystring
+            in which case there is nothing to filter by.
         """
+        if not request.query_params:
+            return queryset
+
         filter_class = self.get_filter_class(view, queryset)
 
         if filter_class:
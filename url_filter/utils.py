@@ -1,10 +1,20 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, print_function, unicode_literals
 import inspect
+from collections import namedtuple
 from contextlib import contextmanager
+from weakref import WeakKeyDictionary
 
 
-class FilterSpec(object):
+_PUBLIC_CLASS_ATTRIBUTES_CACHE = WeakKeyDictionary()
+
+
+class FilterSpec(
+    namedtuple(
+        "FilterSpec",
+        ["components", "lookup", "value", "is_negated", "filter_callable"],
+    )
+):
     """
     Class for describing filter specification.
 
@@ -21,12 +31,13 @@ class FilterSpec(object):
 
     Attributes
     ----------
-    components : list
-        A list of strings which are names of the keys/attributes
+    components : tuple
+        A tuple of strings which are names of the keys/attributes
         to be used in filtering of the queryset.
         For example lookup config with key
         ``user__profile__email`` will have components of
-        ``['user', 'profile', 'email'].
+        ``('user', 'profile', 'email')``.
+        Any other iterable given is converted to a tuple.
     lookup : str
         Name of the lookup how final key/attribute from
         :attr:`.components` should be compared.
@@ -42,16 +53,18 @@ class FilterSpec(object):
         Callable which should be used for filtering this
         filter spec. This is primaliry meant to be used
         by :class:`.CallableFilter`.
+
+    .. note::
+        Specs are immutable. Use ``spec._replace(**kwargs)`` to get
+        a modified copy of a spec.
     """
 
-    def __init__(
-        self, components, lookup, value, is_negated=False, filter_callable=None
-    ):
-        self.components = components
-        self.lookup = lookup
-        self.value = value
-        self.is_negated = is_negated
-        self.filter_callable = filter_callable
+    __slots__ = ()
+
+    def __new__(cls, components, lookup, value, is_negated=False, filter_callable=None):
+        return super(FilterSpec, cls).__new__(
+            cls, tuple(components), lookup, value, is_negated, filter_callable
+        )
 
     @property
     def is_callable(self):
@@ -79,11 +92,12 @@ class FilterSpec(object):
             callable=callable_repr,
         )
 
-    def __eq__(self, other):
-        return hash(self) == hash(other)
-
     def __hash__(self):
-        return hash(repr(self))
+        try:
+            return super(FilterSpec, self).__hash__()
+        except TypeError:
+            # value is not hashable (e.g. list for "in" lookup)
+            return hash(repr(self))
 
 
 class LookupConfig(object):
@@ -123,6 +137,11 @@ class LookupConfig(object):
         * nested dictionary where the key is the next key within
           the lookup chain and value is another :class:`.LookupConfig`
         * the filtering value as provided in the querystring value
+    is_negated : bool
+        Whether the lookup key is negated (e.g. ``user__email!``).
+    is_leaf : bool
+        Whether ``data`` is the filtering value rather than
+        nested :class:`.LookupConfig`.
 
     Parameters
     ----------
@@ -134,21 +153,37 @@ class LookupConfig(object):
         dictionaries to instances of :class:`.LookupConfig`.
         Alternatively a filtering value as provided
         in the querystring.
+    is_negated : bool, optional
+        Whether the lookup key is negated.
+        When not provided, it is computed from the key.
     """
 
-    def __init__(self, key, data):
-        if isinstance(data, dict):
-            data = {k: self.__class__(key, v) for k, v in data.items()}
+    __slots__ = ("key", "data", "is_negated", "is_leaf", "_is_key_value")
+
+    def __init__(self, key, data, is_negated=None):
+        if is_negated is None:
+            is_negated = "!" in key
+
+        is_leaf = not isinstance(data, dict)
+        is_key_value = False
+        if not is_leaf:
+            data = {k: self.__class__(key, v, is_negated) for k, v in data.items()}
+            is_key_value = len(data) == 1 and next(iter(data.values())).is_leaf
 
         self.key = key
         self.data = data
+        self.is_negated = is_negated
+        self.is_leaf = is_leaf
+        self._is_key_value = is_key_value
 
     def is_key_value(self):
         """
         Check if this :class:`.LookupConfig` is not a nested :class:`.LookupConfig`
         but instead the value is a non-dict value.
+
+        This is computed once during initialization.
         """
-        return len(self.data) == 1 and not isinstance(self.value, dict)
+        return self._is_key_value
 
     @property
     def name(self):
@@ -171,9 +206,9 @@ class LookupConfig(object):
         """
         Converts the nested :class:`.LookupConfig` to a regular ``dict``.
         """
-        if isinstance(self.data, dict):
-            return {k: v.as_dict() for k, v in self.data.items()}
-        return self.data
+        if self.is_leaf:
+            return self.data
+        return {k: v.as_dict() for k, v in self.data.items()}
 
     def __repr__(self):
         return "<{} {}=>{}>".format(
@@ -223,6 +258,25 @@ class SubClassDict(dict):
         return value
 
 
+def _get_public_class_attributes(klass):
+    """
+    Get names of all public attributes defined in the class hierarchy
+    such as properties, methods and ``__slots__``.
+
+    Class attributes are static for a class hence they are computed once
+    and cached per class.
+    """
+    try:
+        return _PUBLIC_CLASS_ATTRIBUTES_CACHE[klass]
+    except KeyError:
+        pass
+
+    names = _PUBLIC_CLASS_ATTRIBUTES_CACHE[klass] = tuple(
+        i for i in dir(klass) if not i.startswith("_")
+    )
+    return names
+
+
 def dictify(obj):
     """
     Convert any object to a dictionary.
@@ -230,11 +284,27 @@ def dictify(obj):
     If the given object is already an instance of a dict,
     it is directly returned. If not, then all the public
     attributes of the object are returned as a dict.
+    That includes both instance attributes and attributes
+    defined on the class such as properties.
     """
     if isinstance(obj, dict):
         return obj
-    else:
-        return {k: getattr(obj, k) for k in dir(obj) if not k.startswith("_")}
+
+    try:
+        data = {k: v for k, v in vars(obj).items() if not k.startswith("_")}
+    except TypeError:
+        data = {}
+
+    for k in _get_public_class_attributes(obj.__class__):
+        if k in data:
+            continue
+        try:
+            data[k] = getattr(obj, k)
+        except AttributeError:
+            # e.g. slot was never assigned
+            pass
+
+    return data
 
 
 def dict_pop(key, d):